@@ -37,3 +37,8 @@ def test_qgauss():
             assert np.isclose(z_mean, z0)
             assert np.isclose(z_std, sigma_z)
 
+            res_dev = ctx.zeros(len(z), dtype=np.float64)
+            out_dev = lprofile.line_density(z_dev, res=res_dev)
+            assert out_dev is res_dev
+            assert np.allclose(ctx.nparray_from_context_array(res_dev), lden)
+
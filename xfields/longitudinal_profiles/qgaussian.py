@@ -162,11 +162,14 @@ class LongitudinalProfileQGaussian(xo.dress(LongitudinalProfileQGaussianData)):
         self._z_max = value
         self._recompute_support()
 
-    def line_density(self, z):
+    def line_density(self, z, res=None):
         context = self._buffer.context
-        res = context.zeros(len(z), dtype=np.float64)
+        if res is None:
+            res = context.zeros(len(z), dtype=np.float64)
+        else:
+            assert len(res) == len(z)
 
-        if 'line_density_q_gauss' not in context.kernels.keys():
+        if 'line_density_qgauss' not in context.kernels.keys():
             self.compile_custom_kernels()
 
         context.kernels.line_density_qgauss(prof=self._xobject, n=len(z), z=z, res=res)